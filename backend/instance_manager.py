@@ -2,6 +2,8 @@
 """
 Instance Manager
 Classes for managing multiple software application instances across different operating systems
+
+Not imported by main.py; the /windows routes use window_lister instead.
 """
 
 import logging
@@ -37,6 +39,41 @@ if os_detector.is_windows:
         SW_SHOWNOACTIVATE = 4
         SW_SHOWNORMAL = 1
 
+        # Pin prototypes once so handles are not truncated to 32-bit ints
+        # and ctypes does not re-infer argument types on every call
+        user32.IsWindowVisible.argtypes = [wintypes.HWND]
+        user32.IsWindowVisible.restype = wintypes.BOOL
+        user32.IsIconic.argtypes = [wintypes.HWND]
+        user32.IsIconic.restype = wintypes.BOOL
+        user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+        user32.GetWindowTextLengthW.restype = ctypes.c_int
+        user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        user32.GetWindowTextW.restype = ctypes.c_int
+        user32.GetWindowThreadProcessId.argtypes = [
+            wintypes.HWND,
+            ctypes.POINTER(wintypes.DWORD),
+        ]
+        user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+        user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+        user32.ShowWindow.restype = wintypes.BOOL
+        user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+        user32.SetForegroundWindow.restype = wintypes.BOOL
+        user32.BringWindowToTop.argtypes = [wintypes.HWND]
+        user32.BringWindowToTop.restype = wintypes.BOOL
+        user32.GetForegroundWindow.argtypes = []
+        user32.GetForegroundWindow.restype = wintypes.HWND
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.QueryFullProcessImageNameW.argtypes = [
+            wintypes.HANDLE,
+            wintypes.DWORD,
+            wintypes.LPWSTR,
+            ctypes.POINTER(wintypes.DWORD),
+        ]
+        kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.restype = wintypes.BOOL
+
         WINDOWS_API_AVAILABLE = True
         logger.info("✅ Windows API available for instance management")
     except ImportError:
@@ -50,6 +87,79 @@ else:
     kernel32 = None
 
 
+# macOS AppleScripts are static; names and titles are passed via argv
+# ("on run argv") so user-controlled text is never spliced into the source
+MACOS_FOCUS_SCRIPT = """
+on run argv
+    set appName to item 1 of argv
+    set windowTitle to item 2 of argv
+    tell application "System Events"
+        tell application process appName
+            set frontmost to true
+            try
+                -- Get window count first
+                set windowCount to count of windows
+                log "Total windows: " & windowCount
+
+                -- Try to find and activate the window by name
+                set targetWindow to first window whose name is windowTitle
+
+                -- Bring the target window to front
+                try
+                    set index of targetWindow to 1
+                    log "Method 1 (set index) succeeded"
+                on error
+                    try
+                        perform action "AXRaise" of targetWindow
+                        log "Method 2 (AXRaise) succeeded"
+                    on error
+                        click targetWindow
+                        log "Method 3 (click) succeeded"
+                    end try
+                end try
+
+                -- Verify the window is now frontmost
+                set frontWindow to window 1
+                set frontWindowName to name of frontWindow
+                log "Front window is now: " & frontWindowName
+
+                return "success:" & frontWindowName
+            on error errMsg
+                log "Error: " & errMsg
+                return "error:" & errMsg
+            end try
+        end tell
+    end tell
+end run
+"""
+
+MACOS_FALLBACK_FOCUS_SCRIPT = """
+on run argv
+    set appName to item 1 of argv
+    set workspaceName to item 2 of argv
+    tell application appName
+        activate
+        try
+            set targetWindow to first window whose name contains workspaceName
+            set index of targetWindow to 1
+            return "fallback_success"
+        on error
+            return "app_activated"
+        end try
+    end tell
+end run
+"""
+
+
+def _extract_workspace_name(title: str) -> str:
+    """Extract workspace name from window title"""
+    # Format: "filename — workspace" or "filename - workspace";
+    # the em dash takes precedence, the regular dash is the fallback
+    sep = " — " if " — " in title else " - "
+    parts = title.split(sep, 2)
+    return parts[1].strip() if len(parts) >= 2 else "Unknown"
+
+
 class ApplicationInstanceManager(ABC):
     """Abstract base class for managing software application instances"""
 
@@ -122,36 +232,6 @@ class MacOSApplicationInstanceManager(ApplicationInstanceManager):
             logger.error("❌ macOS instance manager not available")
             return []
 
-        # First, test if we can access application windows
-        count_script = f"""
-        tell application "System Events"
-            set appProcesses to every application process whose name is "{self.application_name}"
-            set totalWindows to 0
-            repeat with appProcess in appProcesses
-                set windowList to every window of appProcess
-                set totalWindows to totalWindows + (count of windowList)
-            end repeat
-            return totalWindows as string
-        end tell
-        """
-
-        try:
-            logger.info(f"🔍 Checking for {self.application_name} windows on macOS...")
-            result = subprocess.run(
-                ["osascript", "-e", count_script],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            if result.stdout.strip() == "0":
-                logger.info(f"📋 No {self.application_name} windows found")
-                return []
-
-        except Exception as e:
-            logger.error(f"❌ Failed to check {self.application_name} windows: {e}")
-            return []
-
         # Get window names and details
         window_script = f"""
         tell application "System Events"
@@ -175,7 +255,7 @@ class MacOSApplicationInstanceManager(ApplicationInstanceManager):
             repeat with i from 1 to count of windowNames
                 set resultString to resultString & item i of windowNames
                 if i < count of windowNames then
-                    set resultString to resultString & "|"
+                    set resultString to resultString & (ASCII character 10)
                 end if
             end repeat
             
@@ -184,7 +264,7 @@ class MacOSApplicationInstanceManager(ApplicationInstanceManager):
         """
 
         try:
-            logger.info(f"🔍 Getting {self.application_name} window names...")
+            logger.info("🔍 Getting %s window names...", self.application_name)
             result = subprocess.run(
                 ["osascript", "-e", window_script],
                 capture_output=True,
@@ -193,16 +273,19 @@ class MacOSApplicationInstanceManager(ApplicationInstanceManager):
             )
 
             if result.stdout.strip():
-                window_names = result.stdout.strip().split("|")
+                # One title per line; titles may contain "|" but never newlines
+                window_names = result.stdout.strip().split("\n")
                 logger.info(
-                    f"📋 Found {len(window_names)} {self.application_name} windows"
+                    "📋 Found %d %s windows",
+                    len(window_names),
+                    self.application_name,
                 )
 
                 instances = []
                 for i, window_name in enumerate(window_names):
                     if window_name.strip():
                         # Extract workspace name from window title
-                        workspace_name = self._extract_workspace_name(window_name)
+                        workspace_name = _extract_workspace_name(window_name)
 
                         instance_info = {
                             "id": f"macos_{i}",
@@ -215,18 +298,20 @@ class MacOSApplicationInstanceManager(ApplicationInstanceManager):
 
                 self.instances_cache = instances
                 logger.info(
-                    f"✅ Found {len(instances)} {self.application_name} instances on macOS"
+                    "✅ Found %d %s instances on macOS",
+                    len(instances),
+                    self.application_name,
                 )
                 return instances
             else:
-                logger.info(f"📋 No {self.application_name} windows found")
+                logger.info("📋 No %s windows found", self.application_name)
                 return []
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"❌ AppleScript execution failed: {e}")
+            logger.error("❌ AppleScript execution failed: %s", e)
             return []
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: %s", e)
             return []
 
     def focus_instance(self, instance_id: str) -> bool:
@@ -243,134 +328,74 @@ class MacOSApplicationInstanceManager(ApplicationInstanceManager):
                 break
 
         if not target_instance:
-            logger.error(f"❌ Instance {instance_id} not found")
+            logger.error("❌ Instance %s not found", instance_id)
             return False
 
         title = target_instance["title"]
         workspace = target_instance["workspace"]
 
-        logger.info(f"🎯 Focusing {self.application_name} instance: {workspace}")
-        logger.info(f"   - Title: {title}")
-
-        # Escape quotes in window title
-        escaped_title = title.replace('"', '\\"')
-
-        script = f"""
-        tell application "System Events"
-            tell application process "{self.application_name}"
-                set frontmost to true
-                try
-                    -- Get window count first
-                    set windowCount to count of windows
-                    log "Total windows: " & windowCount
-                    
-                    -- Try to find and activate the window by name
-                    set targetWindow to first window whose name is "{escaped_title}"
-                    
-                    -- Bring the target window to front
-                    try
-                        set index of targetWindow to 1
-                        log "Method 1 (set index) succeeded"
-                    on error
-                        try
-                            perform action "AXRaise" of targetWindow
-                            log "Method 2 (AXRaise) succeeded"
-                        on error
-                            click targetWindow
-                            log "Method 3 (click) succeeded"
-                        end try
-                    end try
-                    
-                    -- Verify the window is now frontmost
-                    set frontWindow to window 1
-                    set frontWindowName to name of frontWindow
-                    log "Front window is now: " & frontWindowName
-                    
-                    return "success:" & frontWindowName
-                on error errMsg
-                    log "Error: " & errMsg
-                    return "error:" & errMsg
-                end try
-            end tell
-        end tell
-        """
+        logger.info("🎯 Focusing %s instance: %s", self.application_name, workspace)
+        logger.info("   - Title: %s", title)
 
         try:
             logger.info("🍎 Executing AppleScript for window activation...")
             result = subprocess.run(
-                ["osascript", "-e", script], capture_output=True, text=True, check=True
+                ["osascript", "-e", MACOS_FOCUS_SCRIPT, self.application_name, title],
+                capture_output=True,
+                text=True,
+                check=True,
             )
 
             output = result.stdout.strip()
-            logger.info(f"🍎 AppleScript output: '{output}'")
+            logger.info("🍎 AppleScript output: '%s'", output)
 
             if "success:" in output:
                 activated_window = output.split("success:")[1]
-                logger.info(f"✅ Successfully focused window: '{activated_window}'")
+                logger.info("✅ Successfully focused window: '%s'", activated_window)
                 return True
             elif "error:" in output:
                 error_msg = output.split("error:")[1]
-                logger.error(f"❌ AppleScript error: {error_msg}")
+                logger.error("❌ AppleScript error: %s", error_msg)
                 return self._fallback_focus(workspace)
             else:
-                logger.error(f"❌ Unexpected AppleScript output: {output}")
+                logger.error("❌ Unexpected AppleScript output: %s", output)
                 return False
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"❌ Failed to execute AppleScript: {e}")
+            logger.error("❌ Failed to execute AppleScript: %s", e)
             return False
         except Exception as e:
-            logger.error(f"❌ Unexpected error during window activation: {e}")
+            logger.error("❌ Unexpected error during window activation: %s", e)
             return False
 
-    def _extract_workspace_name(self, title: str) -> str:
-        """Extract workspace name from window title"""
-        # Format: "filename — workspace" or "filename - workspace"
-        if " — " in title:  # Using em dash
-            parts = title.split(" — ")
-            if len(parts) >= 2:
-                return parts[1].strip()
-        elif " - " in title:  # Fallback for regular dash
-            parts = title.split(" - ")
-            if len(parts) >= 2:
-                return parts[1].strip()
-        return "Unknown"
-
     def _fallback_focus(self, workspace: str) -> bool:
         """Fallback approach to focus window by workspace"""
         logger.info("🔄 Trying fallback approach...")
 
-        simple_script = f"""
-        tell application "{self.application_name}"
-            activate
-            try
-                set targetWindow to first window whose name contains "{workspace}"
-                set index of targetWindow to 1
-                return "fallback_success"
-            on error
-                return "app_activated"
-            end try
-        end tell
-        """
-
         try:
             fallback_result = subprocess.run(
-                ["osascript", "-e", simple_script],
+                [
+                    "osascript",
+                    "-e",
+                    MACOS_FALLBACK_FOCUS_SCRIPT,
+                    self.application_name,
+                    workspace,
+                ],
                 capture_output=True,
                 text=True,
                 check=True,
             )
 
             fallback_output = fallback_result.stdout.strip()
-            logger.info(f"🔄 Fallback result: '{fallback_output}'")
+            logger.info("🔄 Fallback result: '%s'", fallback_output)
 
             if "success" in fallback_output or "activated" in fallback_output:
-                logger.info(f"✅ Fallback focus succeeded: {workspace}")
+                logger.info("✅ Fallback focus succeeded: %s", workspace)
                 return True
             return False
 
         except Exception as fallback_error:
-            logger.error(f"❌ Fallback approach failed: {fallback_error}")
+            logger.error("❌ Fallback approach failed: %s", fallback_error)
             return False
 
 
@@ -424,145 +449,143 @@ class WindowsApplicationInstanceManager(ApplicationInstanceManager):
 
         try:
             logger.info(
-                f"🔍 Searching for {self.application_name} windows on Windows..."
+                "🔍 Searching for %s windows on Windows...",
+                self.application_name,
             )
-            logger.info(f"🔍 DEBUG: Looking for process names: {self.process_names}")
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug(
+                    "🔍 DEBUG: Looking for process names: %s",
+                    self.process_names,
+                )
 
-            # Use a simple list to collect matches - Windows API callbacks have restrictions
-            found_matches = []
-            all_windows_debug = []
+            # Only collect handles in the callback - Windows API callbacks have
+            # restrictions, so all per-window work happens after enumeration
+            hwnds = []
 
             # Callback function to enumerate windows
-            def enum_windows_callback(hwnd, windows):
-                try:
-                    if user32.IsWindowVisible(hwnd):
-                        # Get window title
-                        title_length = user32.GetWindowTextLengthW(hwnd)
-                        if title_length > 0:
-                            title_buffer = ctypes.create_unicode_buffer(
-                                title_length + 1
-                            )
-                            user32.GetWindowTextW(hwnd, title_buffer, title_length + 1)
-                            title = title_buffer.value
-
-                            # Get process ID
-                            process_id = wintypes.DWORD()
-                            user32.GetWindowThreadProcessId(
-                                hwnd, ctypes.byref(process_id)
-                            )
-
-                            # Get process name
-                            try:
-                                process_handle = kernel32.OpenProcess(
-                                    PROCESS_QUERY_INFORMATION | PROCESS_VM_READ,
-                                    False,
-                                    process_id.value,
-                                )
-                                if process_handle:
-                                    process_name_buffer = ctypes.create_unicode_buffer(
-                                        260
-                                    )
-                                    if kernel32.QueryFullProcessImageNameW(
-                                        process_handle,
-                                        0,
-                                        process_name_buffer,
-                                        ctypes.byref(wintypes.DWORD(260)),
-                                    ):
-                                        process_path = process_name_buffer.value
-                                        process_name = os.path.basename(process_path)
-
-                                        # Check if it matches our target application
-                                        process_lower = process_name.lower()
-                                        target_names_lower = [
-                                            name.lower() for name in self.process_names
-                                        ]
-
-                                        # Add to debug list if relevant
-                                        if any(
-                                            keyword in title.lower()
-                                            for keyword in [
-                                                "cursor",
-                                                "visual studio",
-                                                "code",
-                                                "editor",
-                                            ]
-                                        ) or any(
-                                            keyword in process_name.lower()
-                                            for keyword in ["cursor", "code", "editor"]
-                                        ):
-                                            all_windows_debug.append(
-                                                {
-                                                    "title": title,
-                                                    "process_name": process_name,
-                                                    "process_path": process_path,
-                                                    "matches_target": process_lower
-                                                    in target_names_lower,
-                                                }
-                                            )
-
-                                        # If it matches, add to found_matches
-                                        if process_lower in target_names_lower:
-                                            window_info = {
-                                                "hwnd": hwnd,
-                                                "title": title,
-                                                "process_id": process_id.value,
-                                                "process_name": process_name,
-                                            }
-                                            found_matches.append(window_info)
-
-                                    kernel32.CloseHandle(process_handle)
-                            except Exception as e:
-                                pass  # Silently skip errors in callback
-
-                except Exception as callback_error:
-                    pass  # Silently skip callback errors
-
+            def enum_windows_callback(hwnd, _):
+                hwnds.append(hwnd)
                 return True
 
             # Define callback function type
+            # Same signature as window_lister's, which pins EnumWindows.argtypes
             WNDENUMPROC = ctypes.WINFUNCTYPE(
-                ctypes.c_bool, wintypes.HWND, ctypes.POINTER(ctypes.py_object)
+                wintypes.BOOL, wintypes.HWND, wintypes.LPARAM
             )
 
             # Enumerate all windows
-            logger.info("🔍 DEBUG: Starting window enumeration...")
+            logger.debug("🔍 DEBUG: Starting window enumeration...")
             enum_callback = WNDENUMPROC(enum_windows_callback)
-            user32.EnumWindows(
-                enum_callback, ctypes.py_object(None)
-            )  # We don't use the callback parameter
+            user32.EnumWindows(enum_callback, 0)  # We don't use the callback parameter
+
+            target_names_lower = {name.lower() for name in self.process_names}
+            process_paths = {}  # process_id -> image path, resolved once per process
+            found_matches = []
+            all_windows_debug = []
+
+            for hwnd in hwnds:
+                try:
+                    # Cheap checks first: most top-level windows are hidden or untitled
+                    if not user32.IsWindowVisible(hwnd):
+                        continue
+                    title_length = user32.GetWindowTextLengthW(hwnd)
+                    if title_length <= 0:
+                        continue
+
+                    title_buffer = ctypes.create_unicode_buffer(title_length + 1)
+                    user32.GetWindowTextW(hwnd, title_buffer, title_length + 1)
+                    title = title_buffer.value
+
+                    # Get process ID
+                    process_id = wintypes.DWORD()
+                    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(process_id))
+
+                    if process_id.value not in process_paths:
+                        process_paths[process_id.value] = self._get_process_path(
+                            process_id.value
+                        )
+                    process_path = process_paths[process_id.value]
+                    if not process_path:
+                        continue
+
+                    process_name = os.path.basename(process_path)
+                    process_lower = process_name.lower()
+
+                    # Add to debug list if relevant
+                    if debug_enabled and (
+                        any(
+                            keyword in title.lower()
+                            for keyword in ["cursor", "visual studio", "code", "editor"]
+                        )
+                        or any(
+                            keyword in process_lower
+                            for keyword in ["cursor", "code", "editor"]
+                        )
+                    ):
+                        all_windows_debug.append(
+                            {
+                                "title": title,
+                                "process_name": process_name,
+                                "process_path": process_path,
+                                "matches_target": process_lower in target_names_lower,
+                            }
+                        )
+
+                    # If it matches, add to found_matches
+                    if process_lower in target_names_lower:
+                        found_matches.append(
+                            {
+                                "hwnd": hwnd,
+                                "title": title,
+                                "process_id": process_id.value,
+                                "process_name": process_name,
+                            }
+                        )
+                except Exception:
+                    pass  # Window may have closed since enumeration; skip it
 
             # Now process the matches found outside the callback
-            logger.info(
-                f"🔍 DEBUG: After enumeration, found {len(found_matches)} matches"
-            )
-            for match in found_matches:
-                logger.info(
-                    f"🎯 MATCH FOUND: {match['process_name']} - {match['title']}"
+            if debug_enabled:
+                logger.debug(
+                    "🔍 DEBUG: After enumeration, found %d matches",
+                    len(found_matches),
                 )
+                for match in found_matches:
+                    logger.debug(
+                        "🎯 MATCH FOUND: %s - %s",
+                        match["process_name"],
+                        match["title"],
+                    )
 
             windows = found_matches
 
             # Debug output: Show what we found
-            logger.info(
-                f"🔍 DEBUG: Found {len(all_windows_debug)} potentially relevant windows:"
-            )
-            for debug_window in all_windows_debug[
-                :10
-            ]:  # Limit to first 10 to avoid spam
-                logger.info(f"   - Title: {debug_window['title']}")
-                logger.info(f"     Process: {debug_window['process_name']}")
-                logger.info(f"     Path: {debug_window['process_path']}")
-                logger.info(f"     Matches Target: {debug_window['matches_target']}")
-                logger.info("   ---")
-
-            if len(all_windows_debug) > 10:
-                logger.info(f"   ... and {len(all_windows_debug) - 10} more")
+            if debug_enabled:
+                logger.debug(
+                    "🔍 DEBUG: Found %d potentially relevant windows:",
+                    len(all_windows_debug),
+                )
+                for debug_window in all_windows_debug[
+                    :10
+                ]:  # Limit to first 10 to avoid spam
+                    logger.debug("   - Title: %s", debug_window["title"])
+                    logger.debug("     Process: %s", debug_window["process_name"])
+                    logger.debug("     Path: %s", debug_window["process_path"])
+                    logger.debug(
+                        "     Matches Target: %s",
+                        debug_window["matches_target"],
+                    )
+                    logger.debug("   ---")
+
+                if len(all_windows_debug) > 10:
+                    logger.debug("   ... and %d more", len(all_windows_debug) - 10)
 
             # Process found windows
             instances = []
             for i, window in enumerate(windows):
                 title = window["title"]
-                workspace_name = self._extract_workspace_name(title)
+                workspace_name = _extract_workspace_name(title)
 
                 instance_info = {
                     "id": f"windows_{i}",
@@ -577,12 +600,14 @@ class WindowsApplicationInstanceManager(ApplicationInstanceManager):
 
             self.instances_cache = instances
             logger.info(
-                f"✅ Found {len(instances)} {self.application_name} instances on Windows"
+                "✅ Found %d %s instances on Windows",
+                len(instances),
+                self.application_name,
             )
             return instances
 
         except Exception as e:
-            logger.error(f"❌ Error enumerating Windows: {e}")
+            logger.error("❌ Error enumerating Windows: %s", e)
             return []
 
     def focus_instance(self, instance_id: str) -> bool:
@@ -599,7 +624,7 @@ class WindowsApplicationInstanceManager(ApplicationInstanceManager):
                 break
 
         if not target_instance:
-            logger.error(f"❌ Instance {instance_id} not found")
+            logger.error("❌ Instance %s not found", instance_id)
             return False
 
         hwnd = target_instance["hwnd"]
@@ -607,10 +632,12 @@ class WindowsApplicationInstanceManager(ApplicationInstanceManager):
         title = target_instance["title"]
 
         logger.info(
-            f"🎯 Focusing {self.application_name} instance on Windows: {workspace}"
+            "🎯 Focusing %s instance on Windows: %s",
+            self.application_name,
+            workspace,
         )
-        logger.info(f"   - HWND: {hwnd}")
-        logger.info(f"   - Title: {title}")
+        logger.info("   - HWND: %s", hwnd)
+        logger.info("   - Title: %s", title)
 
         try:
             # Check if window is minimized
@@ -628,28 +655,35 @@ class WindowsApplicationInstanceManager(ApplicationInstanceManager):
             # Check if successful
             foreground_hwnd = user32.GetForegroundWindow()
             if foreground_hwnd == hwnd:
-                logger.info(f"✅ Successfully focused window: {title}")
+                logger.info("✅ Successfully focused window: %s", title)
                 return True
             else:
                 logger.info("✅ Window focus completed (may take effect shortly)")
                 return True
 
         except Exception as e:
-            logger.error(f"❌ Failed to focus window: {e}")
+            logger.error("❌ Failed to focus window: %s", e)
             return False
 
-    def _extract_workspace_name(self, title: str) -> str:
-        """Extract workspace name from window title"""
-        # Format: "filename — workspace" or "filename - workspace"
-        if " — " in title:  # Using em dash
-            parts = title.split(" — ")
-            if len(parts) >= 2:
-                return parts[1].strip()
-        elif " - " in title:  # Fallback for regular dash
-            parts = title.split(" - ")
-            if len(parts) >= 2:
-                return parts[1].strip()
-        return "Unknown"
+    def _get_process_path(self, process_id: int) -> Optional[str]:
+        """Get the executable path of a process, or None if it cannot be queried"""
+        process_handle = kernel32.OpenProcess(
+            PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, False, process_id
+        )
+        if not process_handle:
+            return None
+        try:
+            process_name_buffer = ctypes.create_unicode_buffer(260)
+            if kernel32.QueryFullProcessImageNameW(
+                process_handle,
+                0,
+                process_name_buffer,
+                ctypes.byref(wintypes.DWORD(260)),
+            ):
+                return process_name_buffer.value
+            return None
+        finally:
+            kernel32.CloseHandle(process_handle)
 
 
 class LinuxApplicationInstanceManager(ApplicationInstanceManager):
@@ -669,14 +703,16 @@ class LinuxApplicationInstanceManager(ApplicationInstanceManager):
     def list_instances(self) -> List[Dict[str, Any]]:
         """Linux implementation not available yet"""
         logger.warning(
-            f"⚠️ Linux {self.application_name} instance management not implemented yet"
+            "⚠️ Linux %s instance management not implemented yet",
+            self.application_name,
         )
         return []
 
     def focus_instance(self, instance_id: str) -> bool:
         """Linux implementation not available yet"""
         logger.warning(
-            f"⚠️ Linux {self.application_name} instance management not implemented yet"
+            "⚠️ Linux %s instance management not implemented yet",
+            self.application_name,
         )
         return False
 
@@ -695,18 +731,19 @@ def create_application_instance_manager(
         ApplicationInstanceManager: The appropriate instance manager for the current OS
     """
     if os_detector.is_macos:
-        logger.info(f"🍎 Creating macOS {application_name} instance manager")
+        logger.info("🍎 Creating macOS %s instance manager", application_name)
         return MacOSApplicationInstanceManager(application_name)
     elif os_detector.is_windows:
-        logger.info(f"🪟 Creating Windows {application_name} instance manager")
+        logger.info("🪟 Creating Windows %s instance manager", application_name)
         return WindowsApplicationInstanceManager(application_name)
     elif os_detector.is_linux:
         logger.info(
-            f"🐧 Creating Linux {application_name} instance manager (placeholder)"
+            "🐧 Creating Linux %s instance manager (placeholder)",
+            application_name,
         )
         return LinuxApplicationInstanceManager(application_name)
     else:
-        logger.warning(f"⚠️ Unsupported OS: {os_detector.current_os.value}")
+        logger.warning("⚠️ Unsupported OS: %s", os_detector.current_os.value)
         return LinuxApplicationInstanceManager(
             application_name
         )  # Use placeholder for unsupported OS
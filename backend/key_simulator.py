@@ -4,14 +4,21 @@ Key Simulator Module
 Provides cross-platform keyboard simulation functionality
 """
 
+import string
+import threading
 import time
-from typing import List, Tuple, Optional
+from typing import List, Optional, Sequence, Tuple
 from os_detector import os_detector
 from loguru import logger
 
 try:
     from pynput.keyboard import Key, Controller
     keyboard_controller = Controller()
+    PYNPUT_SPECIAL_KEYS = {
+        "enter": Key.enter, "backspace": Key.backspace, "space": Key.space,
+        "tab": Key.tab, "escape": Key.esc, "esc": Key.esc,
+        "ctrl": Key.ctrl, "shift": Key.shift, "alt": Key.alt, "option": Key.alt, "cmd": Key.cmd,
+    }
     PYNPUT_AVAILABLE = True
     logger.info("pynput keyboard simulation library loaded")
     if os_detector.is_macos:
@@ -23,12 +30,40 @@ try:
 except ImportError:
     PYNPUT_AVAILABLE = False
     keyboard_controller = None
+    PYNPUT_SPECIAL_KEYS = {}
     logger.warning("pynput not available - keyboard simulation disabled")
 
 if os_detector.is_windows:
     try:
         import ctypes
+        from ctypes import wintypes
         user32 = ctypes.windll.user32
+
+        INPUT_KEYBOARD = 1
+
+        class KEYBDINPUT(ctypes.Structure):
+            _fields_ = [
+                ("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t),
+            ]
+
+        class MOUSEINPUT(ctypes.Structure):
+            _fields_ = [
+                ("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t),
+            ]
+
+        class _INPUTUNION(ctypes.Union):
+            # MOUSEINPUT is the largest member; it sizes INPUT as SendInput expects
+            _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT)]
+
+        class INPUT(ctypes.Structure):
+            _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+        INPUT_SIZE = ctypes.sizeof(INPUT)
+        user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+        user32.SendInput.restype = wintypes.UINT
+
         WINDOWS_API_AVAILABLE = True
         logger.info("Windows native keyboard simulation available")
     except (ImportError, AttributeError):
@@ -40,116 +75,136 @@ else:
     user32 = None
 
 
+KEYEVENTF_KEYUP = 0x0002
+
+# Windows keybd flags emitted for each key action, in order
+_KEY_ACTION_FLAGS = {"down": (0,), "up": (KEYEVENTF_KEYUP,), "press": (0, KEYEVENTF_KEYUP)}
+
+# Modifier and special keys only: a character's VK code depends on the keyboard
+# layout and carries no shift state, so characters always go through pynput
+_WINDOWS_VK_CODES = {
+    "ctrl": 0x11, "shift": 0x10, "alt": 0x12, "option": 0x12, "cmd": 0x5B,
+    "enter": 0x0D, "backspace": 0x08, "space": 0x20, "tab": 0x09,
+    "escape": 0x1B, "esc": 0x1B,
+}
+
+# While ctrl/alt/cmd is held Windows matches shortcuts by VK code, which is the
+# same on every layout, so shortcut letters (e.g. the v in ctrl+v) use SendInput too
+_SHORTCUT_MODIFIERS = frozenset({"ctrl", "alt", "option", "cmd"})
+_WINDOWS_SHORTCUT_VK_CODES = {c: ord(c.upper()) for c in string.ascii_lowercase}
+
+
 class KeySimulator:
     """Sequence-based key simulation handler"""
 
     def __init__(self):
         self.current_os = os_detector.current_os
+        self._use_windows_api = os_detector.is_windows and WINDOWS_API_AVAILABLE and user32 is not None
+        # Routes run in FastAPI's threadpool; one sequence at a time keeps modifiers from interleaving
+        self._sequence_lock = threading.Lock()
 
-    def simulate_key_sequence(self, key_sequence: List[Tuple[str, str]]) -> bool:
+    def simulate_key_sequence(self, key_sequence: Sequence[Tuple[str, str]]) -> bool:
         if not self.is_keyboard_available():
             logger.error("Keyboard simulation not available")
             return False
-        try:
-            for i, (key, action) in enumerate(key_sequence):
-                logger.debug("Step %s: %s %s", i + 1, key, action)
-                success = self._simulate_key_action(key, action)
-                if not success:
-                    logger.error("Failed at step %s: %s %s", i + 1, key, action)
-                    return False
-                delay = os_detector.get_os_specific_delay(action)
-                time.sleep(delay)
-            logger.info("Key sequence completed successfully")
-            return True
-        except Exception as e:
-            logger.error("Key sequence simulation failed: %s", e)
-            return False
-
-    def _simulate_key_action(self, key: str, action: str) -> bool:
-        try:
-            if action == "press":
-                return self._press_key(key)
-            if action == "down":
-                return self._key_down(key)
-            if action == "up":
-                return self._key_up(key)
-            logger.error("Invalid key action: %s", action)
-            return False
-        except Exception as e:
-            logger.error("Key action simulation failed: %s", e)
-            return False
-
-    def _key_down(self, key: str) -> bool:
-        try:
-            if self.current_os == "Windows" and WINDOWS_API_AVAILABLE and user32:
-                vk_code = self._get_windows_vk_code(key)
-                if vk_code:
-                    user32.keybd_event(vk_code, 0, 0, 0)
-                    return True
-            if PYNPUT_AVAILABLE and keyboard_controller:
-                pynput_key = self._get_pynput_key(key)
-                keyboard_controller.press(pynput_key)
+        with self._sequence_lock:
+            start_ns = time.perf_counter_ns()
+            try:
+                if self._use_windows_api:
+                    vk_codes = self._windows_vk_codes_for(key_sequence)
+                    events = self._windows_events_for(key_sequence, vk_codes)
+                    if events is not None:
+                        logger.debug("Submitting {} key events in one SendInput batch", len(events))
+                        return self._send_windows_inputs(events)
+                else:
+                    vk_codes = [None] * len(key_sequence)
+                for i, ((key, action), vk_code) in enumerate(zip(key_sequence, vk_codes)):
+                    logger.debug("Step {}: {} {}", i + 1, key, action)
+                    success = self._simulate_key_action(key, action, vk_code)
+                    if not success:
+                        logger.error("Failed at step {}: {} {}", i + 1, key, action)
+                        return False
+                    delay = os_detector.get_os_specific_delay(action)
+                    time.sleep(delay)
+                logger.debug("Key sequence completed in {:.3f}s", (time.perf_counter_ns() - start_ns) / 1e9)
                 return True
+            except Exception as e:
+                logger.error("Key sequence simulation failed: {}", e)
+                return False
+
+    def _simulate_key_action(self, key: str, action: str, vk_code: Optional[int] = None) -> bool:
+        flags = _KEY_ACTION_FLAGS.get(action)
+        if flags is None:
+            logger.error("Invalid key action: {}", action)
             return False
-        except Exception as e:
-            logger.error("Key down failed: %s", e)
-            return False
-
-    def _key_up(self, key: str) -> bool:
         try:
-            if self.current_os == "Windows" and WINDOWS_API_AVAILABLE and user32:
-                vk_code = self._get_windows_vk_code(key)
-                if vk_code:
-                    user32.keybd_event(vk_code, 0, 2, 0)
-                    return True
+            if vk_code:
+                return self._send_windows_inputs([(vk_code, f) for f in flags])
             if PYNPUT_AVAILABLE and keyboard_controller:
                 pynput_key = self._get_pynput_key(key)
-                keyboard_controller.release(pynput_key)
+                if action != "up":
+                    keyboard_controller.press(pynput_key)
+                if action != "down":
+                    keyboard_controller.release(pynput_key)
                 return True
             return False
         except Exception as e:
-            logger.error("Key up failed: %s", e)
+            logger.error("Key {} failed for {}: {}", action, key, e)
             return False
 
-    def _press_key(self, key_name: str) -> bool:
-        try:
-            if self.current_os == "Windows" and WINDOWS_API_AVAILABLE and user32:
-                if key_name == "enter":
-                    user32.keybd_event(0x0D, 0, 0, 0)
-                    user32.keybd_event(0x0D, 0, 2, 0)
-                    return True
-            if PYNPUT_AVAILABLE and keyboard_controller:
-                pynput_key = self._get_pynput_key(key_name)
-                keyboard_controller.press(pynput_key)
-                keyboard_controller.release(pynput_key)
-                return True
-            return False
-        except Exception as e:
-            logger.error("Single key press failed: %s", e)
+    @classmethod
+    def _windows_vk_codes_for(cls, key_sequence: Sequence[Tuple[str, str]]) -> List[Optional[int]]:
+        """VK code for each step, or None where the step goes through pynput."""
+        held = set()
+        vk_codes = []
+        for key, action in key_sequence:
+            vk_codes.append(cls._get_windows_vk_code(key, bool(held)) if key else None)
+            name = key.lower() if key else ""
+            if name in _SHORTCUT_MODIFIERS:
+                if action == "down":
+                    held.add(name)
+                elif action == "up":
+                    held.discard(name)
+        return vk_codes
+
+    @staticmethod
+    def _windows_events_for(
+        key_sequence: Sequence[Tuple[str, str]], vk_codes: List[Optional[int]]
+    ) -> Optional[List[Tuple[int, int]]]:
+        """Translate a sequence to (vk_code, flags) events, or None if any step needs pynput."""
+        events = []
+        for (key, action), vk_code in zip(key_sequence, vk_codes):
+            flags = _KEY_ACTION_FLAGS.get(action)
+            if flags is None or vk_code is None:
+                return None
+            events.extend((vk_code, f) for f in flags)
+        return events
+
+    @staticmethod
+    def _send_windows_inputs(events: List[Tuple[int, int]]) -> bool:
+        """Submit (vk_code, flags) keyboard events to the OS in one SendInput call."""
+        inputs = (INPUT * len(events))(*(
+            INPUT(INPUT_KEYBOARD, _INPUTUNION(ki=KEYBDINPUT(vk_code, 0, flags, 0, 0)))
+            for vk_code, flags in events
+        ))
+        sent = user32.SendInput(len(events), inputs, INPUT_SIZE)
+        if sent != len(events):
+            logger.error("SendInput delivered {} of {} events", sent, len(events))
             return False
+        return True
 
     @staticmethod
-    def _get_windows_vk_code(key: str) -> Optional[int]:
-        vk_codes = {
-            "ctrl": 0x11, "shift": 0x10, "alt": 0x12, "option": 0x12, "cmd": 0x5B,
-            "enter": 0x0D, "backspace": 0x08, "space": 0x20, "tab": 0x09,
-            "escape": 0x1B, "esc": 0x1B,
-            "a": 0x41, "b": 0x42, "c": 0x43, "d": 0x44, "e": 0x45, "f": 0x46,
-            "g": 0x47, "h": 0x48, "i": 0x49, "j": 0x4A, "k": 0x4B, "l": 0x4C,
-            "m": 0x4D, "n": 0x4E, "o": 0x4F, "p": 0x50, "q": 0x51, "r": 0x52,
-            "s": 0x53, "t": 0x54, "u": 0x55, "v": 0x56, "w": 0x57, "x": 0x58,
-            "y": 0x59, "z": 0x5A,
-        }
-        return vk_codes.get(key.lower())
+    def _get_windows_vk_code(key: str, shortcut_held: bool = False) -> Optional[int]:
+        # Same lookup for down, up and press, so a key always takes one path
+        vk_code = _WINDOWS_VK_CODES.get(key.lower())
+        if vk_code is None and shortcut_held:
+            # Lowercase letters only: "V" stays on pynput, which adds shift
+            vk_code = _WINDOWS_SHORTCUT_VK_CODES.get(key)
+        return vk_code
 
     @staticmethod
     def _get_pynput_key(key_name: str):
-        special_keys = {
-            "enter": Key.enter, "backspace": Key.backspace, "space": Key.space,
-            "tab": Key.tab, "escape": Key.esc, "esc": Key.esc,
-            "ctrl": Key.ctrl, "shift": Key.shift, "alt": Key.alt, "option": Key.alt, "cmd": Key.cmd,
-        }
-        return special_keys.get(key_name, key_name)
+        return PYNPUT_SPECIAL_KEYS.get(key_name, key_name)
 
     @staticmethod
     def is_keyboard_available() -> bool:
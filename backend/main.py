@@ -7,7 +7,7 @@ Serves frontend build from backend/static when present.
 
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pyperclip
 from fastapi import FastAPI, HTTPException
@@ -109,6 +109,28 @@ class SettingsBody(BaseModel):
     touchpad_sensitivity: Optional[float] = None
 
 
+# profile_id -> (profile it was built from, action_sequence_id -> key-only steps).
+# profile_store hands back the same dict until the file changes, so identity marks staleness.
+_action_index: Dict[str, Tuple[dict, Dict[str, List[Tuple[str, str]]]]] = {}
+
+
+def _compile_action_index(profile: dict) -> Dict[str, List[Tuple[str, str]]]:
+    """Resolve every action sequence of a profile to its key steps (state_change actions dropped)."""
+    index = {}
+    for btn in profile.get("buttons", []):
+        for state_data in btn.get("states", {}).values():
+            for event_data in state_data.get("actions", {}).values():
+                seq_id = event_data.get("id")
+                if not seq_id or seq_id in index:
+                    continue
+                index[seq_id] = [
+                    (action.get("key"), action.get("action", "press"))
+                    for action in event_data.get("sequence", [])
+                    if isinstance(action, dict) and action.get("type") == "key"
+                ]
+    return index
+
+
 def _button_to_out(b: dict) -> dict:
     if "states" in b:
         return {
@@ -201,8 +223,9 @@ def update_profile(profile_id: str, body: ProfileUpdate):
                 "classes": b.get("classes", ""),
                 "key_sequence": keys_list,
             })
-    store_save_profile(profile_id, body.name, buttons)
-    return get_profile(profile_id)
+    if not store_save_profile(profile_id, body.name, buttons):
+        raise HTTPException(status_code=500, detail="Failed to save profile")
+    return {"id": profile_id, "name": body.name, "buttons": buttons}
 
 
 @app.delete("/profiles/{profile_id}")
@@ -211,6 +234,7 @@ def remove_profile(profile_id: str):
     if not get_profile(profile_id):
         raise HTTPException(status_code=404, detail="Profile not found")
     store_delete_profile(profile_id)
+    _action_index.pop(profile_id, None)
     return {"ok": True}
 
 
@@ -249,26 +273,12 @@ def simulate(body: SimulateBody):
         profile = get_profile(pid)
         if not profile:
             raise HTTPException(status_code=400, detail="Active profile not found")
-        buttons = profile.get("buttons", [])
-        action_seq = None
-        for btn in buttons:
-            states = btn.get("states", {})
-            for state_name, state_data in states.items():
-                actions = state_data.get("actions", {})
-                for event_type, event_data in actions.items():
-                    if event_data.get("id") == body.action_sequence_id:
-                        action_seq = event_data.get("sequence", [])
-                        break
-                if action_seq is not None:
-                    break
-            if action_seq is not None:
-                break
-        if action_seq is None:
+        cached = _action_index.get(pid)
+        if cached is None or cached[0] is not profile:
+            cached = _action_index[pid] = (profile, _compile_action_index(profile))
+        key_sequence = cached[1].get(body.action_sequence_id)
+        if key_sequence is None:
             raise HTTPException(status_code=404, detail="Action sequence not found")
-        key_sequence = []
-        for action in action_seq:
-            if isinstance(action, dict) and action.get("type") == "key":
-                key_sequence.append([action.get("key"), action.get("action", "press")])
     elif body.button_id:
         pid = get_current_profile_id()
         if not pid:
@@ -11,6 +11,7 @@ from loguru import logger
 try:
     from pynput.mouse import Button, Controller
     mouse_controller = Controller()
+    _BUTTONS = {"left": Button.left, "right": Button.right, "middle": Button.middle}
     PYNPUT_MOUSE_AVAILABLE = True
     logger.info("pynput mouse simulation library loaded")
 except ImportError:
@@ -34,11 +35,13 @@ class MouseController:
         if not PYNPUT_MOUSE_AVAILABLE or not mouse_controller:
             logger.error("Mouse simulation not available")
             return False
+        if dx == 0 and dy == 0:
+            return True  # Nothing to do; skip posting an empty OS input event
         try:
             mouse_controller.move(dx, dy)
             return True
         except Exception as e:
-            logger.error("Mouse move failed: %s", e)
+            logger.error("Mouse move failed: {}", e)
             return False
 
     def click(self, button: Literal["left", "right", "middle"] = "left") -> bool:
@@ -47,11 +50,11 @@ class MouseController:
             logger.error("Mouse simulation not available")
             return False
         try:
-            btn = {"left": Button.left, "right": Button.right, "middle": Button.middle}.get(button, Button.left)
+            btn = _BUTTONS.get(button, Button.left)
             mouse_controller.click(btn)
             return True
         except Exception as e:
-            logger.error("Mouse click failed: %s", e)
+            logger.error("Mouse click failed: {}", e)
             return False
 
 
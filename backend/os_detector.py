@@ -4,10 +4,13 @@ Operating System Detection Module
 Centralized OS detection using enumeration to eliminate redundant detection across modules
 """
 
-import platform
 import logging
+import sys
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
+
+# Immutable (key, action) steps, shared by every caller
+KeySequence = Tuple[Tuple[str, str], ...]
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,14 @@ class OperatingSystem(Enum):
     UNKNOWN = "Unknown"
 
 
+# sys.platform is fixed when the interpreter is built; no uname() call needed
+_PLATFORM_OS = {
+    "darwin": OperatingSystem.MACOS,
+    "win32": OperatingSystem.WINDOWS,
+    "linux": OperatingSystem.LINUX,
+}
+
+
 class OSDetector:
     """Centralized operating system detection and management"""
 
@@ -34,61 +45,59 @@ class OSDetector:
 
     def _detect_os(self) -> None:
         if self._detected_os is None:
-            system_name = platform.system()
-            try:
-                self._detected_os = OperatingSystem(system_name)
+            self._detected_os = _PLATFORM_OS.get(sys.platform)
+            if self._detected_os is None:
+                logger.warning("Unknown OS: %s - using Linux defaults", sys.platform)
+                self._detected_os = OperatingSystem.LINUX
+            else:
                 logger.info("Detected operating system: %s", self._detected_os.value)
                 if self._detected_os == OperatingSystem.MACOS:
                     logger.info("macOS detected - will use Cmd+V for paste operations")
                 elif self._detected_os == OperatingSystem.WINDOWS:
                     logger.info("Windows detected - will use Ctrl+V for paste operations")
-                elif self._detected_os == OperatingSystem.LINUX:
-                    logger.info("Linux detected - will use Ctrl+V for paste operations")
                 else:
-                    logger.warning("Unsupported OS: %s - using Linux defaults", system_name)
-            except ValueError:
-                logger.warning("Unknown OS: %s - using Linux defaults", system_name)
-                self._detected_os = OperatingSystem.LINUX
+                    logger.info("Linux detected - will use Ctrl+V for paste operations")
+            # Everything derived from the OS is fixed for the process; compute it once
+            self._is_macos = self._detected_os == OperatingSystem.MACOS
+            self._is_windows = self._detected_os == OperatingSystem.WINDOWS
+            self._is_linux = self._detected_os == OperatingSystem.LINUX
+            self._modifier_key = "cmd" if self._is_macos else "ctrl"
+            mod = self._modifier_key
+            self._paste_seq = ((mod, "down"), ("v", "press"), (mod, "up"))
+            self._copy_seq = ((mod, "down"), ("c", "press"), (mod, "up"))
+            self._select_all_seq = ((mod, "down"), ("a", "press"), (mod, "up"))
 
     @property
     def current_os(self) -> OperatingSystem:
-        if self._detected_os is None:
-            self._detect_os()
-        return self._detected_os or OperatingSystem.LINUX
+        return self._detected_os
 
     @property
     def is_macos(self) -> bool:
-        return self._detected_os == OperatingSystem.MACOS
+        return self._is_macos
 
     @property
     def is_windows(self) -> bool:
-        return self._detected_os == OperatingSystem.WINDOWS
+        return self._is_windows
 
     @property
     def is_linux(self) -> bool:
-        return self._detected_os == OperatingSystem.LINUX
+        return self._is_linux
 
     @property
     def modifier_key(self) -> str:
-        return "cmd" if self.is_macos else "ctrl"
+        return self._modifier_key
 
     @property
-    def paste_key_sequence(self) -> list:
-        if self.is_macos:
-            return [("cmd", "down"), ("v", "press"), ("cmd", "up")]
-        return [("ctrl", "down"), ("v", "press"), ("ctrl", "up")]
+    def paste_key_sequence(self) -> KeySequence:
+        return self._paste_seq
 
     @property
-    def copy_key_sequence(self) -> list:
-        if self.is_macos:
-            return [("cmd", "down"), ("c", "press"), ("cmd", "up")]
-        return [("ctrl", "down"), ("c", "press"), ("ctrl", "up")]
+    def copy_key_sequence(self) -> KeySequence:
+        return self._copy_seq
 
     @property
-    def select_all_key_sequence(self) -> list:
-        if self.is_macos:
-            return [("cmd", "down"), ("a", "press"), ("cmd", "up")]
-        return [("ctrl", "down"), ("a", "press"), ("ctrl", "up")]
+    def select_all_key_sequence(self) -> KeySequence:
+        return self._select_all_seq
 
     def get_os_specific_delay(self, action_type: str = "default") -> float:
         if self.is_macos:
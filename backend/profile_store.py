@@ -8,7 +8,7 @@ import logging
 import re
 import uuid
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -27,13 +27,45 @@ def _ensure_dir() -> None:
     CURRENT_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 
+# path -> ((st_mtime_ns, st_size), parsed JSON); a parse is reused while both match.
+# Size guards against coarse mtime resolution (HFS+, FAT, network mounts), but an
+# outside edit that keeps both size and mtime is still only seen after the next write.
+_json_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _file_key(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, reusing the previous parse while its mtime and size are unchanged.
+    Callers must treat the result as read-only."""
+    key = _file_key(path)
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    data = json.loads(path.read_text(encoding="utf-8"))
+    _json_cache[path] = (key, data)
+    return data
+
+
+def _write_json(path: Path, data: Any, **dumps_kwargs: Any) -> None:
+    path.write_text(json.dumps(data, **dumps_kwargs), encoding="utf-8")
+    _json_cache[path] = (_file_key(path), data)
+
+
 def list_profiles() -> List[dict]:
     """List all profiles (id and name) by scanning JSON files in PROFILES_DIR."""
     _ensure_dir()
     out = []
-    for p in PROFILES_DIR.glob("*.json"):
+    paths = list(PROFILES_DIR.glob("*.json"))
+    # Drop cached parses of profiles deleted outside the API
+    for stale in _json_cache.keys() - set(paths) - {CURRENT_FILE}:
+        _json_cache.pop(stale, None)
+    for p in paths:
         try:
-            data = json.loads(p.read_text(encoding="utf-8"))
+            data = _read_json(p)
             out.append({"id": data.get("id", p.stem), "name": data.get("name", p.stem)})
         except Exception as e:
             logger.warning("Skip invalid profile %s: %s", p.name, e)
@@ -45,9 +77,10 @@ def get_profile(profile_id: str) -> Optional[dict]:
     _ensure_dir()
     path = PROFILES_DIR / f"{profile_id}.json"
     if not path.exists():
+        _json_cache.pop(path, None)
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _read_json(path)
     except Exception as e:
         logger.error("Failed to load profile %s: %s", profile_id, e)
         return None
@@ -59,7 +92,7 @@ def save_profile(profile_id: str, name: str, buttons: List[dict]) -> bool:
     path = PROFILES_DIR / f"{profile_id}.json"
     data = {"id": profile_id, "name": name, "buttons": buttons}
     try:
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        _write_json(path, data, indent=2, ensure_ascii=False)
         return True
     except Exception as e:
         logger.error("Failed to save profile %s: %s", profile_id, e)
@@ -71,6 +104,7 @@ def delete_profile(profile_id: str) -> bool:
     _ensure_dir()
     path = PROFILES_DIR / f"{profile_id}.json"
     try:
+        _json_cache.pop(path, None)
         if path.exists():
             path.unlink()
             return True
@@ -85,8 +119,7 @@ def get_current_profile_id() -> Optional[str]:
     if not CURRENT_FILE.exists():
         return None
     try:
-        data = json.loads(CURRENT_FILE.read_text(encoding="utf-8"))
-        return data.get("profile_id")
+        return _read_json(CURRENT_FILE).get("profile_id")
     except Exception:
         return None
 
@@ -96,10 +129,11 @@ def set_current_profile_id(profile_id: Optional[str]) -> bool:
     _ensure_dir()
     try:
         if profile_id is None:
+            _json_cache.pop(CURRENT_FILE, None)
             if CURRENT_FILE.exists():
                 CURRENT_FILE.unlink()
             return True
-        CURRENT_FILE.write_text(json.dumps({"profile_id": profile_id}), encoding="utf-8")
+        _write_json(CURRENT_FILE, {"profile_id": profile_id})
         return True
     except Exception as e:
         logger.error("Failed to set current profile: %s", e)
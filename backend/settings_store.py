@@ -5,6 +5,7 @@ Settings storage: single JSON file for global application settings.
 import json
 import logging
 from pathlib import Path
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +15,15 @@ DEFAULT_SETTINGS = {
     "touchpad_sensitivity": 1.5
 }
 
+# Last settings read from or written to SETTINGS_FILE; this process is the only writer
+_cached_settings: Optional[dict] = None
+
 
 def _ensure_dir() -> None:
     SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 
-def get_settings() -> dict:
-    """Load settings from disk, or return defaults if file doesn't exist."""
+def _load_settings() -> dict:
     _ensure_dir()
     if not SETTINGS_FILE.exists():
         return DEFAULT_SETTINGS.copy()
@@ -34,13 +37,23 @@ def get_settings() -> dict:
         return DEFAULT_SETTINGS.copy()
 
 
+def get_settings() -> dict:
+    """Return settings, loading them from disk (or defaults) on first use."""
+    global _cached_settings
+    if _cached_settings is None:
+        _cached_settings = _load_settings()
+    return _cached_settings.copy()
+
+
 def update_settings(settings: dict) -> bool:
     """Update settings (partial update supported). Merges with existing settings."""
+    global _cached_settings
     _ensure_dir()
     current = get_settings()
     current.update(settings)
     try:
         SETTINGS_FILE.write_text(json.dumps(current, indent=2, ensure_ascii=False), encoding="utf-8")
+        _cached_settings = current
         return True
     except Exception as e:
         logger.error("Failed to save settings: %s", e)
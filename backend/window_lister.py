@@ -4,6 +4,7 @@ Used by Panel to switch between windows. macOS: AppleScript; Windows: user32.
 """
 
 import subprocess
+import threading
 from typing import List
 
 from os_detector import os_detector
@@ -13,6 +14,32 @@ from loguru import logger
 # Id separator for macOS (app + title); avoid characters likely in window titles
 _ID_SEP = "\x1f"
 
+# Serializes osascript calls (see _run_osascript)
+_OSASCRIPT_LOCK = threading.Lock()
+
+# Static script; app name and title arrive via argv so they never need quoting
+_ACTIVATE_MACOS_SCRIPT = '''
+on run argv
+    set appName to item 1 of argv
+    set windowTitle to item 2 of argv
+    tell application "System Events"
+        tell process appName
+            set frontmost to true
+            try
+                set targetWindow to first window whose name is windowTitle
+                set index of targetWindow to 1
+                return "ok"
+            on error
+                try
+                    perform action "AXRaise" of targetWindow
+                end try
+                return "ok"
+            end try
+        end tell
+    end tell
+end run
+'''
+
 if os_detector.is_windows:
     try:
         import ctypes
@@ -22,6 +49,25 @@ if os_detector.is_windows:
         _PROCESS_QUERY = 0x0400
         _PROCESS_VM_READ = 0x0010
         _SW_RESTORE = 9
+        # Pin prototypes once so HWNDs are passed as pointer-sized handles (not
+        # truncated to a C int) and ctypes does not infer types on every call
+        _WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+        _user32.EnumWindows.argtypes = [_WNDENUMPROC, wintypes.LPARAM]
+        _user32.EnumWindows.restype = wintypes.BOOL
+        _user32.IsWindowVisible.argtypes = [wintypes.HWND]
+        _user32.IsWindowVisible.restype = wintypes.BOOL
+        _user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+        _user32.GetWindowTextLengthW.restype = ctypes.c_int
+        _user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        _user32.GetWindowTextW.restype = ctypes.c_int
+        _user32.IsIconic.argtypes = [wintypes.HWND]
+        _user32.IsIconic.restype = wintypes.BOOL
+        _user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+        _user32.ShowWindow.restype = wintypes.BOOL
+        _user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+        _user32.SetForegroundWindow.restype = wintypes.BOOL
+        _user32.BringWindowToTop.argtypes = [wintypes.HWND]
+        _user32.BringWindowToTop.restype = wintypes.BOOL
         _WINDOWS_AVAILABLE = True
     except Exception:
         _user32 = _kernel32 = None
@@ -36,11 +82,19 @@ def list_windows() -> List[dict]:
     Return list of visible windows. Each item: { "id": str, "title": str, "app": str? }.
     id is used for activate_window(id). On Windows id is hwnd; on macOS id is "app\\x1ftitle".
     """
-    if os_detector.is_macos:
-        return _list_windows_macos()
-    if os_detector.is_windows and _WINDOWS_AVAILABLE:
-        return _list_windows_windows()
-    return []
+    return _list_impl()
+
+
+def _run_osascript(script: str, *args: str, timeout: float) -> subprocess.CompletedProcess:
+    # Routes run in FastAPI's threadpool; System Events handles one query at a
+    # time, so overlapping osascript processes only queue up and slow each other
+    with _OSASCRIPT_LOCK:
+        return subprocess.run(
+            ["osascript", "-e", script, *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
 
 
 def _list_windows_macos() -> List[dict]:
@@ -69,19 +123,14 @@ def _list_windows_macos() -> List[dict]:
     end tell
     """
     try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        result = _run_osascript(script, timeout=10)
         out = (result.stdout or "").strip()
         err = (result.stderr or "").strip()
         if result.returncode != 0:
-            logger.warning(f"list_windows macOS osascript failed (code={result.returncode}) stderr: {err or '(none)'}")
+            logger.warning("list_windows macOS osascript failed (code={}) stderr: {}", result.returncode, err or "(none)")
             return []
         if not out:
-            logger.warning(f"list_windows macOS osascript returned no output. stderr: {err or '(none)'}")
+            logger.warning("list_windows macOS osascript returned no output. stderr: {}", err or "(none)")
             return []
         windows = []
         for line in out.split("\n"):
@@ -98,70 +147,54 @@ def _list_windows_macos() -> List[dict]:
             windows.append({"id": wid, "title": title, "app": app_name})
         return windows
     except Exception as e:
-        logger.warning("list_windows macOS failed: %s", e)
+        logger.warning("list_windows macOS failed: {}", e)
         return []
 
 
 def _list_windows_windows() -> List[dict]:
-    found = []
+    hwnds = []
 
+    # Only collect handles here; per-window calls run after EnumWindows returns
     def callback(hwnd, _):
-        try:
-            if _user32.IsWindowVisible(hwnd):
-                length = _user32.GetWindowTextLengthW(hwnd)
-                if length > 0:
-                    buf = ctypes.create_unicode_buffer(length + 1)
-                    _user32.GetWindowTextW(hwnd, buf, length + 1)
-                    title = buf.value.strip()
-                    if title:
-                        found.append({"hwnd": hwnd, "title": title})
-        except Exception:
-            pass
+        hwnds.append(hwnd)
         return True
 
-    WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, ctypes.c_void_p)
-    _user32.EnumWindows(WNDENUMPROC(callback), None)
-    return [{"id": str(w["hwnd"]), "title": w["title"], "app": None} for w in found]
+    _user32.EnumWindows(_WNDENUMPROC(callback), 0)
+
+    windows = []
+    for hwnd in hwnds:
+        try:
+            if not _user32.IsWindowVisible(hwnd):
+                continue
+            length = _user32.GetWindowTextLengthW(hwnd)
+            if length <= 0:
+                continue
+            buf = ctypes.create_unicode_buffer(length + 1)
+            _user32.GetWindowTextW(hwnd, buf, length + 1)
+            title = buf.value.strip()
+            if title:
+                windows.append({"id": str(hwnd), "title": title, "app": None})
+        except Exception:
+            pass  # Window may have closed since enumeration; skip it
+    return windows
 
 
 def activate_window(window_id: str) -> bool:
     """Bring the window identified by window_id to front. Returns True if successful."""
     if not window_id:
         return False
-    if os_detector.is_macos:
-        return _activate_macos(window_id)
-    if os_detector.is_windows and _WINDOWS_AVAILABLE:
-        return _activate_windows(window_id)
-    return False
+    return _activate_impl(window_id)
 
 
 def _activate_macos(window_id: str) -> bool:
     if _ID_SEP not in window_id:
         return False
     app_name, title = window_id.split(_ID_SEP, 1)
-    esc_title = title.replace("\\", "\\\\").replace('"', '\\"')
-    script = f'''
-    tell application "System Events"
-        tell process "{app_name}"
-            set frontmost to true
-            try
-                set targetWindow to first window whose name is "{esc_title}"
-                set index of targetWindow to 1
-                return "ok"
-            on error
-                try
-                    perform action "AXRaise" of targetWindow
-                end try
-                return "ok"
-            end try
-        end tell
-    end tell
-    '''
     try:
-        r = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=5)
+        r = _run_osascript(_ACTIVATE_MACOS_SCRIPT, app_name, title, timeout=5)
         return r.returncode == 0 and "error" not in (r.stderr or "").lower()
     except Exception as e:
-        logger.warning(f"activate_window macOS failed: {e}")
+        logger.warning("activate_window macOS failed: {}", e)
         return False
 
 
@@ -177,10 +210,27 @@ def _activate_windows(window_id: str) -> bool:
         _user32.BringWindowToTop(hwnd)
         return True
     except Exception as e:
-        logger.warning(f"activate_window Windows failed: {e}")
+        logger.warning("activate_window Windows failed: {}", e)
         return False
 
 
+def _list_unsupported() -> List[dict]:
+    return []
+
+
+def _activate_unsupported(window_id: str) -> bool:
+    return False
+
+
+# Platform implementations are chosen once at import; the OS cannot change at runtime
+if os_detector.is_macos:
+    _list_impl, _activate_impl = _list_windows_macos, _activate_macos
+elif os_detector.is_windows and _WINDOWS_AVAILABLE:
+    _list_impl, _activate_impl = _list_windows_windows, _activate_windows
+else:
+    _list_impl, _activate_impl = _list_unsupported, _activate_unsupported
+
+
 if __name__ == "__main__":
     for w in list_windows():
         print(w.get("id", ""), w.get("title", ""), w.get("app") or "", sep='###')
@@ -5,8 +5,10 @@ export const SPECIAL_KEYS = [
 
 export const KEY_ACTIONS = ['down', 'press', 'up']
 
+const SPECIAL_KEY_SET = new Set(SPECIAL_KEYS)
+
 export function isSpecialKey(key) {
-  return SPECIAL_KEYS.includes((key || '').toLowerCase())
+  return !!key && SPECIAL_KEY_SET.has(key.toLowerCase())
 }
 
 export function defaultActionForKey(key) {